@@ -1,13 +1,9 @@
 import pygame
 import sys
 
-# Initialize Pygame
-pygame.init()
-
-# Set up the display
+# Display size and frame rate
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Traffic Simulation (Scaffold)")
+FPS = 60
 
 # Car properties
 def draw_car(surface, x, y):
@@ -19,19 +15,33 @@ def draw_car(surface, x, y):
     pygame.draw.circle(surface, WHEEL_COLOR, (x+15, y+CAR_HEIGHT), 7)
     pygame.draw.circle(surface, WHEEL_COLOR, (x+CAR_WIDTH-15, y+CAR_HEIGHT), 7)
 
-car_x = WIDTH // 2 - 30
-car_y = HEIGHT // 2 - 15
+def main():
+    # Initialize Pygame
+    pygame.init()
+
+    # Set up the display
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Traffic Simulation (Scaffold)")
+
+    car_x = WIDTH // 2 - 30
+    car_y = HEIGHT // 2 - 15
+
+    clock = pygame.time.Clock()
+
+    # Main loop
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
 
-# Main loop
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+        screen.fill((30, 30, 30))  # Fill the screen with a dark color
+        draw_car(screen, car_x, car_y)
+        pygame.display.flip()
+        clock.tick(FPS)  # Cap the frame rate instead of busy-looping
 
-    screen.fill((30, 30, 30))  # Fill the screen with a dark color
-    draw_car(screen, car_x, car_y)
-    pygame.display.flip()
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
+if __name__ == '__main__':
+    main()